@@ -15,7 +15,6 @@ Usage:
 ###############################################################################################################################################################
 
 import argparse
-import typing
 
 from currency_codes import FX_CODES
 from country_codes import COUNTRY_CODES
@@ -28,12 +27,13 @@ from country_codes import COUNTRY_CODES
 ###############################################################################################################################################################
 
 def country_from_currency_iso(iso: str) -> int:
-    if (country := FX_CODES.country_from_currency_iso(iso)) is None:
+    iso_upper = iso.upper()
+    if (country := FX_CODES._country_from_upper_currency_iso(iso_upper)) is None:
         print(f"Unknown currency ISO: {iso}")
         return -1
     if country in COUNTRY_CODES.codes:
         country = COUNTRY_CODES[country]
-    print(f"{iso}: {country} ({FX_CODES.currency_from_currency_iso(iso)})")
+    print(f"{iso}: {country} ({FX_CODES._currency_from_upper_currency_iso(iso_upper)})")
     return 0
 
 
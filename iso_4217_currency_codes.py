@@ -8,12 +8,17 @@ Mapping ISO 4217 currency symbols to countries and currencies.
 #
 ###############################################################################################################################################################
 
-from collections import defaultdict
 from pathlib import Path
 from functools import cached_property
 import json
 import typing
 
+# The lookup maps pregenerated by tools/gen_iso_data.py, if available.
+try:
+    from currency_codes import iso_4217_data
+except ImportError:
+    iso_4217_data = None
+
 
 ###############################################################################################################################################################
 #
@@ -23,6 +28,9 @@ import typing
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 
+# Returned for unknown countries and currencies, so a miss doesn't allocate a new set.
+_EMPTY_SET = frozenset()
+
 
 ###############################################################################################################################################################
 #
@@ -43,107 +51,253 @@ class FxCodes:
     JSON_CURRENCY_OWNER = "Owner"
     JSON_CURRENCY_MAIN  = "Primary"
 
-    @cached_property
-    def data_file(self) -> Path:
-        """ The path to the file containg the primary ISO 4217 currency code data. """
-        return SCRIPT_DIR/"iso_4217_currency_codes.json"
+    # The file containg the primary ISO 4217 currency code data.
+    DATA_FILE = SCRIPT_DIR/"iso_4217_currency_codes.json"
+
+    # The cached properties written out as iso_4217_data module constants by tools/gen_iso_data.py.
+    GENERATED_PROPERTIES = {
+        "_currency_indices": "CURRENCY_INDICES",
+        "_country_indices":  "COUNTRY_INDICES",
+    }
+
+    def __init__(self, use_generated_data: bool = True):
+        # Use the pregenerated lookup maps when available, skipping the parse and map building.
+        # Assigning to the instance dictionary shadows the corresponding cached properties.
+        # The maps are copied, so mutating one instance's maps doesn't affect other instances.
+        self.use_generated_data = use_generated_data and iso_4217_data is not None
+        if self.use_generated_data:
+            for name, constant in self.GENERATED_PROPERTIES.items():
+                self.__dict__[name] = {key: value.copy() if isinstance(value, dict) else value for key, value in getattr(iso_4217_data, constant).items()}
 
     @cached_property
     def json_data(self) -> json:
         """ The contents of the json datafile as a list of maps. """
-        data = json.loads(self.data_file.read_text(encoding="utf-8"))
+        # orjson is faster at parsing but optional, and costly to import, so only try it when the data is actually parsed.
+        try:
+            import orjson
+        except ImportError:
+            raw_data = self.DATA_FILE.read_bytes()
+            self._check_generated_data(raw_data)
+            data = json.loads(raw_data)
+        else:
+            # orjson parses straight from a buffer, so map the file rather than reading a copy of it.
+            import mmap
+            with open(self.DATA_FILE, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                self._check_generated_data(view)
+                data = orjson.loads(view)
         return tuple(entry for entry in data if entry.get(self.JSON_CURRENCY_ISO) is not None)
 
+    def _check_generated_data(self, raw_data: bytes) -> None:
+        """ Raise an FxCodesException if the generated lookup maps in use were not generated from raw_data. """
+        # Only checked when the json is parsed, so the usual import path stays free of file I/O and hashing.
+        if self.use_generated_data:
+            import hashlib
+            if hashlib.sha256(raw_data).hexdigest() != iso_4217_data.DATA_FILE_SHA256:
+                raise FxCodesException(f"{iso_4217_data.__file__} is out of date with {self.DATA_FILE}, rerun tools/gen_iso_data.py")
+
     @cached_property
-    def currencies(self) -> set[str]:
-        """ A set containing all known currency names. """
-        return set(entry[self.JSON_CURRENCY] for entry in self.json_data)
+    def _entries(self) -> tuple[tuple[str, str, str, str, str, bool, bool], ...]:
+        """ The json data as (iso, currency, country, uppercase currency, uppercase country, is owner, is primary) tuples. """
+        # Bind the json keys locally, so the loop avoids repeated attribute lookups.
+        iso_key, currency_key, country_key = self.JSON_CURRENCY_ISO, self.JSON_CURRENCY, self.JSON_COUNTRY
+        owner_key, primary_key = self.JSON_CURRENCY_OWNER, self.JSON_CURRENCY_MAIN
+        entries = []
+        for entry in self.json_data:
+            currency = entry[currency_key]
+            country = entry[country_key]
+            entries.append((entry[iso_key], currency, country, currency.upper(), country.upper(), bool(entry.get(owner_key)), bool(entry.get(primary_key))))
+        return tuple(entries)
 
     @cached_property
-    def currency_iso_codes(self) -> set[str]:
-        """ A set containing all known ISO currency codes. """
-        return set(entity[self.JSON_CURRENCY_ISO] for entity in self.json_data)
+    def _currency_indices(self) -> dict:
+        """ The lookup maps keyed by currency ISO or currency name, built together in a single pass over the entries. """
+        # Dictionaries de-duplicate while keeping the data file order, for conversion to tuples.
+        currencies = {}
+        currency_to_currency_iso_map = {}
+        currency_iso_to_currency_map = {}
+        currency_iso_to_countries_map = {}
+        currency_iso_to_owner_country_map = {}
+        for iso, currency, country, currency_upper, _, is_owner, _ in self._entries:
+            currencies[currency] = None
+            currency_to_currency_iso_map[currency_upper] = iso
+            currency_iso_to_currency_map[iso] = currency
+            currency_iso_to_countries_map.setdefault(iso, []).append(country)
+            if is_owner:
+                currency_iso_to_owner_country_map[iso] = country
+        # The maps are read only once built, so freeze the accumulated values.
+        currency_iso_to_countries_map = {iso: frozenset(countries) for iso, countries in currency_iso_to_countries_map.items()}
+        return {
+            "currencies":                        tuple(currencies),
+            "currency_iso_codes":                tuple(currency_iso_to_currency_map),
+            "currency_to_currency_iso_map":      currency_to_currency_iso_map,
+            "currency_iso_to_currency_map":      currency_iso_to_currency_map,
+            "currency_iso_to_countries_map":     currency_iso_to_countries_map,
+            "currency_iso_to_owner_country_map": currency_iso_to_owner_country_map,
+        }
 
     @cached_property
-    def countries(self) -> set[str]:
-        """ A set containing all known ISO country codes or country names. """
-        return set(entry[self.JSON_COUNTRY] for entry in self.json_data)
+    def _country_indices(self) -> dict:
+        """ The lookup maps keyed by country, built together in a single pass over the entries. """
+        countries = {}
+        country_to_currency_isos_map = {}
+        country_to_primary_currency_iso_map = {}
+        for iso, _, country, _, country_upper, _, is_primary in self._entries:
+            countries[country] = None
+            country_to_currency_isos_map.setdefault(country_upper, []).append(iso)
+            if is_primary:
+                country_to_primary_currency_iso_map[country_upper] = iso
+        # The maps are read only once built, so freeze the accumulated values.
+        country_to_currency_isos_map = {country: frozenset(isos) for country, isos in country_to_currency_isos_map.items()}
+        # Most countries use a single currency, whose ISO can then be returned without inspecting the set.
+        country_to_sole_currency_iso_map = {country: next(iter(isos)) for country, isos in country_to_currency_isos_map.items() if len(isos) == 1}
+        return {
+            "countries":                           tuple(countries),
+            "country_to_currency_isos_map":        country_to_currency_isos_map,
+            "country_to_primary_currency_iso_map": country_to_primary_currency_iso_map,
+            "country_to_sole_currency_iso_map":    country_to_sole_currency_iso_map,
+        }
+
+    @cached_property
+    def currencies(self) -> tuple[str, ...]:
+        """ A tuple containing all known currency names. """
+        return self._currency_indices["currencies"]
+
+    @cached_property
+    def currency_iso_codes(self) -> tuple[str, ...]:
+        """ A tuple containing all known ISO currency codes. """
+        return self._currency_indices["currency_iso_codes"]
+
+    @cached_property
+    def countries(self) -> tuple[str, ...]:
+        """ A tuple containing all known ISO country codes or country names. """
+        return self._country_indices["countries"]
 
     @cached_property
     def currency_to_currency_iso_map(self) -> dict[str, str]:
         """ A map of uppercase currency names to currency ISOs. """
-        return {entry[self.JSON_CURRENCY].upper(): entry[self.JSON_CURRENCY_ISO] for entry in self.json_data}
+        return self._currency_indices["currency_to_currency_iso_map"]
 
     @cached_property
     def currency_iso_to_currency_map(self) -> dict[str, str]:
         """ A map of currency ISOs to currency names. """
-        return {entry[self.JSON_CURRENCY_ISO]: entry[self.JSON_CURRENCY] for entry in self.json_data}
+        return self._currency_indices["currency_iso_to_currency_map"]
 
     @cached_property
-    def country_to_currency_isos_map(self):
-        country_to_currency_isos_map = defaultdict(set)
-        for entry in self.json_data:
-            country_to_currency_isos_map[entry[self.JSON_COUNTRY].upper()].add(entry[self.JSON_CURRENCY_ISO])
-        return country_to_currency_isos_map
+    def country_to_currency_isos_map(self) -> dict[str, frozenset[str]]:
+        """ A map of uppercase country names to the set of currency ISOs used by each country. """
+        return self._country_indices["country_to_currency_isos_map"]
 
     @cached_property
-    def currency_iso_to_countries_map(self):
-        currency_iso_to_countries_map = defaultdict(set)
-        for entry in self.json_data:
-            currency_iso_to_countries_map[entry[self.JSON_CURRENCY_ISO]].add(entry[self.JSON_COUNTRY])
-        return currency_iso_to_countries_map
+    def currency_iso_to_countries_map(self) -> dict[str, frozenset[str]]:
+        """ A map of currency ISOs to the set of countries using each currency. """
+        return self._currency_indices["currency_iso_to_countries_map"]
 
     @cached_property
-    def currency_iso_to_owner_country_map(self):
-        return {entry[self.JSON_CURRENCY_ISO]: entry[self.JSON_COUNTRY] for entry in self.json_data if entry.get(self.JSON_CURRENCY_OWNER)}
+    def currency_iso_to_owner_country_map(self) -> dict[str, str]:
+        """ A map of currency ISOs to the country or collective owning the currency. """
+        return self._currency_indices["currency_iso_to_owner_country_map"]
 
     @cached_property
-    def country_to_primary_currency_iso_map(self):
-        return {entry[self.JSON_COUNTRY].upper(): entry[self.JSON_CURRENCY_ISO] for entry in self.json_data if entry.get(self.JSON_CURRENCY_MAIN)}
+    def country_to_primary_currency_iso_map(self) -> dict[str, str]:
+        """ A map of uppercase country names to the primary currency ISO of countries using several currencies. """
+        return self._country_indices["country_to_primary_currency_iso_map"]
+
+    @cached_property
+    def _country_to_sole_currency_iso_map(self) -> dict[str, str]:
+        """ A map of uppercase country names to the currency ISO of countries using only one currency. """
+        return self._country_indices["country_to_sole_currency_iso_map"]
+
+    # Bound get methods of the maps queried by every lookup, saving an attribute lookup per query.
+    @cached_property
+    def _currency_to_currency_iso_map_get(self) -> typing.Callable[[str], str | None]:
+        """ The bound get method of currency_to_currency_iso_map. """
+        return self.currency_to_currency_iso_map.get
+
+    @cached_property
+    def _currency_iso_to_currency_map_get(self) -> typing.Callable[[str], str | None]:
+        """ The bound get method of currency_iso_to_currency_map. """
+        return self.currency_iso_to_currency_map.get
+
+    @cached_property
+    def _country_to_currency_isos_map_get(self) -> typing.Callable[[str, frozenset[str]], frozenset[str]]:
+        """ The bound get method of country_to_currency_isos_map. """
+        return self.country_to_currency_isos_map.get
+
+    @cached_property
+    def _currency_iso_to_countries_map_get(self) -> typing.Callable[[str, frozenset[str]], frozenset[str]]:
+        """ The bound get method of currency_iso_to_countries_map. """
+        return self.currency_iso_to_countries_map.get
+
+    @cached_property
+    def _country_to_sole_currency_iso_map_get(self) -> typing.Callable[[str], str | None]:
+        """ The bound get method of _country_to_sole_currency_iso_map. """
+        return self._country_to_sole_currency_iso_map.get
 
     def currency_iso_from_currency(self, currency: str) -> str:
         """ Return the ISO currency code for the named currency. """
-        return self.currency_to_currency_iso_map.get(currency.upper())
+        return self._currency_to_currency_iso_map_get(currency.upper())
 
     def currency_from_currency_iso(self, iso: str) -> str:
         """ Return the name of the currency corresponding to the ISO currency code. """
-        return self.currency_iso_to_currency_map.get(iso.upper())
+        return self._currency_from_upper_currency_iso(iso.upper())
 
-    def currency_isos_from_country(self, country: str) -> set[str]:
+    def _currency_from_upper_currency_iso(self, iso: str) -> str:
+        """ As currency_from_currency_iso, for an ISO currency code already in uppercase. """
+        return self._currency_iso_to_currency_map_get(iso)
+
+    def currency_isos_from_country(self, country: str) -> frozenset[str]:
         """ Return all ISO currency codes for the currencies used by country. """
-        isos = self.country_to_currency_isos_map.get(country.upper())
-        return set() if isos is None else isos
+        return self._country_to_currency_isos_map_get(country.upper(), _EMPTY_SET)
 
     def currency_iso_from_country(self, country: str) -> str:
         """ Return the primary ISO currency code for the currency used by country. """
-        currency_isos = self.currency_isos_from_country(country)
-        if (count := len(currency_isos)) == 0:
+        country_upper = country.upper()
+        if (sole := self._country_to_sole_currency_iso_map_get(country_upper)) is not None:
+            return sole
+        elif not (currency_isos := self._country_to_currency_isos_map_get(country_upper, _EMPTY_SET)):
             return None
-        elif count == 1:
-            return next(iter(currency_isos))
-        elif (primary := self.country_to_primary_currency_iso_map.get(country.upper())) is not None:
+        elif (primary := self.country_to_primary_currency_iso_map.get(country_upper)) is not None:
             return primary
         raise FxCodesException(f"No unique currency ISO for country ISO '{country}' possibilities: {currency_isos}")
         
-    def countries_from_currency_iso(self, currency_iso: str) -> list[str]:
+    def countries_from_currency_iso(self, currency_iso: str) -> frozenset[str]:
         """ Return all countries using an ISO currency code. """
-        countries = self.currency_iso_to_countries_map.get(currency_iso.upper())
-        return set() if countries is None else countries
+        return self._currency_iso_to_countries_map_get(currency_iso.upper(), _EMPTY_SET)
 
     def country_from_currency_iso(self, currency_iso: str) -> str:
         """ Return the primary country or collective owning an ISO currency code. """
-        countries = self.countries_from_currency_iso(currency_iso)
-        if (count := len(countries)) == 0:
+        return self._country_from_upper_currency_iso(currency_iso.upper())
+
+    def _country_from_upper_currency_iso(self, currency_iso: str) -> str:
+        """ As country_from_currency_iso, for an ISO currency code already in uppercase. """
+        if not (countries := self._currency_iso_to_countries_map_get(currency_iso, _EMPTY_SET)):
             return None
-        elif count == 1:
+        elif len(countries) == 1:
             return next(iter(countries))
-        elif (owner := self.currency_iso_to_owner_country_map.get(currency_iso.upper())):
+        elif (owner := self.currency_iso_to_owner_country_map.get(currency_iso)):
             return owner
         raise FxCodesException(f"No unique ownership for ISO '{currency_iso}' used by: {countries}")
 
+    def countries_from_currency_isos(self, currency_isos: typing.Iterable[str]) -> dict[str, str]:
+        """ Return a map of each ISO currency code to its primary country or collective, as per country_from_currency_iso. """
+        # Bind the lookups locally, so the loop avoids repeated attribute and method lookups.
+        get_countries = self._currency_iso_to_countries_map_get
+        get_owner = self.currency_iso_to_owner_country_map.get
+        country_map = {}
+        for currency_iso in currency_isos:
+            currency_iso_upper = currency_iso.upper()
+            if not (countries := get_countries(currency_iso_upper, _EMPTY_SET)):
+                country = None
+            elif len(countries) == 1:
+                country = next(iter(countries))
+            elif not (country := get_owner(currency_iso_upper)):
+                raise FxCodesException(f"No unique ownership for ISO '{currency_iso_upper}' used by: {countries}")
+            country_map[currency_iso] = country
+        return country_map
+
     def __getitem__(self, currency_iso: str) -> str:
         """ Return the primary owner of an ISO currency code. """
-        return self.country_from_currency_iso(currency_iso)
+        return self._country_from_upper_currency_iso(currency_iso.upper())
 
 
 ###############################################################################################################################################################
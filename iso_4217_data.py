@@ -0,0 +1,1739 @@
+"""
+Literal ISO 4217 currency code lookup maps.
+
+Generated from iso_4217_currency_codes.json by tools/gen_iso_data.py - do not edit.
+"""
+
+DATA_FILE_SHA256 = "8b56821297094cf54b1a58403e7eb5c899bf03afde3092565946472e8de4b5c6"
+
+CURRENCY_INDICES = {
+    'currencies': (
+        'Afghani',
+        'Euro',
+        'Lek',
+        'Algerian Dinar',
+        'US Dollar',
+        'Kwanza',
+        'East Caribbean Dollar',
+        'Argentine Peso',
+        'Armenian Dram',
+        'Aruban Florin',
+        'Australian Dollar',
+        'Azerbaijan Manat',
+        'Bahamian Dollar',
+        'Bahraini Dinar',
+        'Taka',
+        'Barbados Dollar',
+        'Belarusian Ruble',
+        'Belize Dollar',
+        'CFA Franc BCEAO',
+        'Bermudian Dollar',
+        'Indian Rupee',
+        'Ngultrum',
+        'Boliviano',
+        'Mvdol',
+        'Convertible Mark',
+        'Pula',
+        'Norwegian Krone',
+        'Brazilian Real',
+        'Brunei Dollar',
+        'Bulgarian Lev',
+        'Burundi Franc',
+        'Cabo Verde Escudo',
+        'Riel',
+        'CFA Franc BEAC',
+        'Canadian Dollar',
+        'Cayman Islands Dollar',
+        'Chilean Peso',
+        'Unidad de Fomento',
+        'Yuan Renminbi',
+        'Colombian Peso',
+        'Unidad de Valor Real',
+        'Comorian Franc',
+        'Congolese Franc',
+        'New Zealand Dollar',
+        'Costa Rican Colon',
+        'Kuna',
+        'Cuban Peso',
+        'Peso Convertible',
+        'Netherlands Antillean Guilder',
+        'Czech Koruna',
+        'Danish Krone',
+        'Djibouti Franc',
+        'Dominican Peso',
+        'Egyptian Pound',
+        'El Salvador Colon',
+        'Nakfa',
+        'Lilangeni',
+        'Ethiopian Birr',
+        'Falkland Islands Pound',
+        'Fiji Dollar',
+        'CFP Franc',
+        'Dalasi',
+        'Lari',
+        'Ghana Cedi',
+        'Gibraltar Pound',
+        'Quetzal',
+        'Pound Sterling',
+        'Guinean Franc',
+        'Guyana Dollar',
+        'Gourde',
+        'Lempira',
+        'Hong Kong Dollar',
+        'Forint',
+        'Iceland Krona',
+        'Rupiah',
+        'SDR (Special Drawing Right)',
+        'Iranian Rial',
+        'Iraqi Dinar',
+        'New Israeli Sheqel',
+        'Jamaican Dollar',
+        'Yen',
+        'Jordanian Dinar',
+        'Tenge',
+        'Kenyan Shilling',
+        'North Korean Won',
+        'Won',
+        'Kuwaiti Dinar',
+        'Som',
+        'Lao Kip',
+        'Lebanese Pound',
+        'Loti',
+        'Rand',
+        'Liberian Dollar',
+        'Libyan Dinar',
+        'Swiss Franc',
+        'Pataca',
+        'Denar',
+        'Malagasy Ariary',
+        'Malawi Kwacha',
+        'Malaysian Ringgit',
+        'Rufiyaa',
+        'Ouguiya',
+        'Mauritius Rupee',
+        'ADB Unit of Account',
+        'Mexican Peso',
+        'Mexican Unidad de Inversion (UDI)',
+        'Moldovan Leu',
+        'Tugrik',
+        'Moroccan Dirham',
+        'Mozambique Metical',
+        'Kyat',
+        'Namibia Dollar',
+        'Nepalese Rupee',
+        'Cordoba Oro',
+        'Naira',
+        'Rial Omani',
+        'Pakistan Rupee',
+        'Balboa',
+        'Kina',
+        'Guarani',
+        'Sol',
+        'Philippine Peso',
+        'Zloty',
+        'Qatari Rial',
+        'Romanian Leu',
+        'Russian Ruble',
+        'Rwanda Franc',
+        'Saint Helena Pound',
+        'Tala',
+        'Dobra',
+        'Saudi Riyal',
+        'Serbian Dinar',
+        'Seychelles Rupee',
+        'Leone',
+        'Singapore Dollar',
+        'Sucre',
+        'Solomon Islands Dollar',
+        'Somali Shilling',
+        'South Sudanese Pound',
+        'Sri Lanka Rupee',
+        'Sudanese Pound',
+        'Surinam Dollar',
+        'Swedish Krona',
+        'WIR Euro',
+        'WIR Franc',
+        'Syrian Pound',
+        'New Taiwan Dollar',
+        'Somoni',
+        'Tanzanian Shilling',
+        'Baht',
+        "Pa'anga",
+        'Trinidad and Tobago Dollar',
+        'Tunisian Dinar',
+        'Turkish Lira',
+        'Turkmenistan New Manat',
+        'Uganda Shilling',
+        'Hryvnia',
+        'UAE Dirham',
+        'US Dollar (Next day)',
+        'Peso Uruguayo',
+        'Uruguay Peso en Unidades Indexadas (UI)',
+        'Unidad Previsional',
+        'Uzbekistan Sum',
+        'Vatu',
+        'Bolívar Soberano',
+        'Dong',
+        'Yemeni Rial',
+        'Zambian Kwacha',
+        'Zimbabwe Dollar',
+        'Bond Markets Unit European Composite Unit (EURCO)',
+        'Bond Markets Unit European Monetary Unit (E.M.U.-6)',
+        'Bond Markets Unit European Unit of Account 9 (E.U.A.-9)',
+        'Bond Markets Unit European Unit of Account 17 (E.U.A.-17)',
+        'Codes specifically reserved for testing purposes',
+        'The codes assigned for transactions where no currency is involved',
+        'Gold',
+        'Palladium',
+        'Platinum',
+        'Silver',
+    ),
+    'currency_iso_codes': (
+        'AFN',
+        'EUR',
+        'ALL',
+        'DZD',
+        'USD',
+        'AOA',
+        'XCD',
+        'ARS',
+        'AMD',
+        'AWG',
+        'AUD',
+        'AZN',
+        'BSD',
+        'BHD',
+        'BDT',
+        'BBD',
+        'BYN',
+        'BZD',
+        'XOF',
+        'BMD',
+        'INR',
+        'BTN',
+        'BOB',
+        'BOV',
+        'BAM',
+        'BWP',
+        'NOK',
+        'BRL',
+        'BND',
+        'BGN',
+        'BIF',
+        'CVE',
+        'KHR',
+        'XAF',
+        'CAD',
+        'KYD',
+        'CLP',
+        'CLF',
+        'CNY',
+        'COP',
+        'COU',
+        'KMF',
+        'CDF',
+        'NZD',
+        'CRC',
+        'HRK',
+        'CUP',
+        'CUC',
+        'ANG',
+        'CZK',
+        'DKK',
+        'DJF',
+        'DOP',
+        'EGP',
+        'SVC',
+        'ERN',
+        'SZL',
+        'ETB',
+        'FKP',
+        'FJD',
+        'XPF',
+        'GMD',
+        'GEL',
+        'GHS',
+        'GIP',
+        'GTQ',
+        'GBP',
+        'GNF',
+        'GYD',
+        'HTG',
+        'HNL',
+        'HKD',
+        'HUF',
+        'ISK',
+        'IDR',
+        'XDR',
+        'IRR',
+        'IQD',
+        'ILS',
+        'JMD',
+        'JPY',
+        'JOD',
+        'KZT',
+        'KES',
+        'KPW',
+        'KRW',
+        'KWD',
+        'KGS',
+        'LAK',
+        'LBP',
+        'LSL',
+        'ZAR',
+        'LRD',
+        'LYD',
+        'CHF',
+        'MOP',
+        'MKD',
+        'MGA',
+        'MWK',
+        'MYR',
+        'MVR',
+        'MRU',
+        'MUR',
+        'XUA',
+        'MXN',
+        'MXV',
+        'MDL',
+        'MNT',
+        'MAD',
+        'MZN',
+        'MMK',
+        'NAD',
+        'NPR',
+        'NIO',
+        'NGN',
+        'OMR',
+        'PKR',
+        'PAB',
+        'PGK',
+        'PYG',
+        'PEN',
+        'PHP',
+        'PLN',
+        'QAR',
+        'RON',
+        'RUB',
+        'RWF',
+        'SHP',
+        'WST',
+        'STN',
+        'SAR',
+        'RSD',
+        'SCR',
+        'SLL',
+        'SGD',
+        'XSU',
+        'SBD',
+        'SOS',
+        'SSP',
+        'LKR',
+        'SDG',
+        'SRD',
+        'SEK',
+        'CHE',
+        'CHW',
+        'SYP',
+        'TWD',
+        'TJS',
+        'TZS',
+        'THB',
+        'TOP',
+        'TTD',
+        'TND',
+        'TRY',
+        'TMT',
+        'UGX',
+        'UAH',
+        'AED',
+        'USN',
+        'UYU',
+        'UYI',
+        'UYW',
+        'UZS',
+        'VUV',
+        'VES',
+        'VND',
+        'YER',
+        'ZMW',
+        'ZWL',
+        'XBA',
+        'XBB',
+        'XBC',
+        'XBD',
+        'XTS',
+        'XXX',
+        'XAU',
+        'XPD',
+        'XPT',
+        'XAG',
+    ),
+    'currency_to_currency_iso_map': {
+        'AFGHANI': 'AFN',
+        'EURO': 'EUR',
+        'LEK': 'ALL',
+        'ALGERIAN DINAR': 'DZD',
+        'US DOLLAR': 'USD',
+        'KWANZA': 'AOA',
+        'EAST CARIBBEAN DOLLAR': 'XCD',
+        'ARGENTINE PESO': 'ARS',
+        'ARMENIAN DRAM': 'AMD',
+        'ARUBAN FLORIN': 'AWG',
+        'AUSTRALIAN DOLLAR': 'AUD',
+        'AZERBAIJAN MANAT': 'AZN',
+        'BAHAMIAN DOLLAR': 'BSD',
+        'BAHRAINI DINAR': 'BHD',
+        'TAKA': 'BDT',
+        'BARBADOS DOLLAR': 'BBD',
+        'BELARUSIAN RUBLE': 'BYN',
+        'BELIZE DOLLAR': 'BZD',
+        'CFA FRANC BCEAO': 'XOF',
+        'BERMUDIAN DOLLAR': 'BMD',
+        'INDIAN RUPEE': 'INR',
+        'NGULTRUM': 'BTN',
+        'BOLIVIANO': 'BOB',
+        'MVDOL': 'BOV',
+        'CONVERTIBLE MARK': 'BAM',
+        'PULA': 'BWP',
+        'NORWEGIAN KRONE': 'NOK',
+        'BRAZILIAN REAL': 'BRL',
+        'BRUNEI DOLLAR': 'BND',
+        'BULGARIAN LEV': 'BGN',
+        'BURUNDI FRANC': 'BIF',
+        'CABO VERDE ESCUDO': 'CVE',
+        'RIEL': 'KHR',
+        'CFA FRANC BEAC': 'XAF',
+        'CANADIAN DOLLAR': 'CAD',
+        'CAYMAN ISLANDS DOLLAR': 'KYD',
+        'CHILEAN PESO': 'CLP',
+        'UNIDAD DE FOMENTO': 'CLF',
+        'YUAN RENMINBI': 'CNY',
+        'COLOMBIAN PESO': 'COP',
+        'UNIDAD DE VALOR REAL': 'COU',
+        'COMORIAN FRANC': 'KMF',
+        'CONGOLESE FRANC': 'CDF',
+        'NEW ZEALAND DOLLAR': 'NZD',
+        'COSTA RICAN COLON': 'CRC',
+        'KUNA': 'HRK',
+        'CUBAN PESO': 'CUP',
+        'PESO CONVERTIBLE': 'CUC',
+        'NETHERLANDS ANTILLEAN GUILDER': 'ANG',
+        'CZECH KORUNA': 'CZK',
+        'DANISH KRONE': 'DKK',
+        'DJIBOUTI FRANC': 'DJF',
+        'DOMINICAN PESO': 'DOP',
+        'EGYPTIAN POUND': 'EGP',
+        'EL SALVADOR COLON': 'SVC',
+        'NAKFA': 'ERN',
+        'LILANGENI': 'SZL',
+        'ETHIOPIAN BIRR': 'ETB',
+        'FALKLAND ISLANDS POUND': 'FKP',
+        'FIJI DOLLAR': 'FJD',
+        'CFP FRANC': 'XPF',
+        'DALASI': 'GMD',
+        'LARI': 'GEL',
+        'GHANA CEDI': 'GHS',
+        'GIBRALTAR POUND': 'GIP',
+        'QUETZAL': 'GTQ',
+        'POUND STERLING': 'GBP',
+        'GUINEAN FRANC': 'GNF',
+        'GUYANA DOLLAR': 'GYD',
+        'GOURDE': 'HTG',
+        'LEMPIRA': 'HNL',
+        'HONG KONG DOLLAR': 'HKD',
+        'FORINT': 'HUF',
+        'ICELAND KRONA': 'ISK',
+        'RUPIAH': 'IDR',
+        'SDR (SPECIAL DRAWING RIGHT)': 'XDR',
+        'IRANIAN RIAL': 'IRR',
+        'IRAQI DINAR': 'IQD',
+        'NEW ISRAELI SHEQEL': 'ILS',
+        'JAMAICAN DOLLAR': 'JMD',
+        'YEN': 'JPY',
+        'JORDANIAN DINAR': 'JOD',
+        'TENGE': 'KZT',
+        'KENYAN SHILLING': 'KES',
+        'NORTH KOREAN WON': 'KPW',
+        'WON': 'KRW',
+        'KUWAITI DINAR': 'KWD',
+        'SOM': 'KGS',
+        'LAO KIP': 'LAK',
+        'LEBANESE POUND': 'LBP',
+        'LOTI': 'LSL',
+        'RAND': 'ZAR',
+        'LIBERIAN DOLLAR': 'LRD',
+        'LIBYAN DINAR': 'LYD',
+        'SWISS FRANC': 'CHF',
+        'PATACA': 'MOP',
+        'DENAR': 'MKD',
+        'MALAGASY ARIARY': 'MGA',
+        'MALAWI KWACHA': 'MWK',
+        'MALAYSIAN RINGGIT': 'MYR',
+        'RUFIYAA': 'MVR',
+        'OUGUIYA': 'MRU',
+        'MAURITIUS RUPEE': 'MUR',
+        'ADB UNIT OF ACCOUNT': 'XUA',
+        'MEXICAN PESO': 'MXN',
+        'MEXICAN UNIDAD DE INVERSION (UDI)': 'MXV',
+        'MOLDOVAN LEU': 'MDL',
+        'TUGRIK': 'MNT',
+        'MOROCCAN DIRHAM': 'MAD',
+        'MOZAMBIQUE METICAL': 'MZN',
+        'KYAT': 'MMK',
+        'NAMIBIA DOLLAR': 'NAD',
+        'NEPALESE RUPEE': 'NPR',
+        'CORDOBA ORO': 'NIO',
+        'NAIRA': 'NGN',
+        'RIAL OMANI': 'OMR',
+        'PAKISTAN RUPEE': 'PKR',
+        'BALBOA': 'PAB',
+        'KINA': 'PGK',
+        'GUARANI': 'PYG',
+        'SOL': 'PEN',
+        'PHILIPPINE PESO': 'PHP',
+        'ZLOTY': 'PLN',
+        'QATARI RIAL': 'QAR',
+        'ROMANIAN LEU': 'RON',
+        'RUSSIAN RUBLE': 'RUB',
+        'RWANDA FRANC': 'RWF',
+        'SAINT HELENA POUND': 'SHP',
+        'TALA': 'WST',
+        'DOBRA': 'STN',
+        'SAUDI RIYAL': 'SAR',
+        'SERBIAN DINAR': 'RSD',
+        'SEYCHELLES RUPEE': 'SCR',
+        'LEONE': 'SLL',
+        'SINGAPORE DOLLAR': 'SGD',
+        'SUCRE': 'XSU',
+        'SOLOMON ISLANDS DOLLAR': 'SBD',
+        'SOMALI SHILLING': 'SOS',
+        'SOUTH SUDANESE POUND': 'SSP',
+        'SRI LANKA RUPEE': 'LKR',
+        'SUDANESE POUND': 'SDG',
+        'SURINAM DOLLAR': 'SRD',
+        'SWEDISH KRONA': 'SEK',
+        'WIR EURO': 'CHE',
+        'WIR FRANC': 'CHW',
+        'SYRIAN POUND': 'SYP',
+        'NEW TAIWAN DOLLAR': 'TWD',
+        'SOMONI': 'TJS',
+        'TANZANIAN SHILLING': 'TZS',
+        'BAHT': 'THB',
+        "PA'ANGA": 'TOP',
+        'TRINIDAD AND TOBAGO DOLLAR': 'TTD',
+        'TUNISIAN DINAR': 'TND',
+        'TURKISH LIRA': 'TRY',
+        'TURKMENISTAN NEW MANAT': 'TMT',
+        'UGANDA SHILLING': 'UGX',
+        'HRYVNIA': 'UAH',
+        'UAE DIRHAM': 'AED',
+        'US DOLLAR (NEXT DAY)': 'USN',
+        'PESO URUGUAYO': 'UYU',
+        'URUGUAY PESO EN UNIDADES INDEXADAS (UI)': 'UYI',
+        'UNIDAD PREVISIONAL': 'UYW',
+        'UZBEKISTAN SUM': 'UZS',
+        'VATU': 'VUV',
+        'BOLÍVAR SOBERANO': 'VES',
+        'DONG': 'VND',
+        'YEMENI RIAL': 'YER',
+        'ZAMBIAN KWACHA': 'ZMW',
+        'ZIMBABWE DOLLAR': 'ZWL',
+        'BOND MARKETS UNIT EUROPEAN COMPOSITE UNIT (EURCO)': 'XBA',
+        'BOND MARKETS UNIT EUROPEAN MONETARY UNIT (E.M.U.-6)': 'XBB',
+        'BOND MARKETS UNIT EUROPEAN UNIT OF ACCOUNT 9 (E.U.A.-9)': 'XBC',
+        'BOND MARKETS UNIT EUROPEAN UNIT OF ACCOUNT 17 (E.U.A.-17)': 'XBD',
+        'CODES SPECIFICALLY RESERVED FOR TESTING PURPOSES': 'XTS',
+        'THE CODES ASSIGNED FOR TRANSACTIONS WHERE NO CURRENCY IS INVOLVED': 'XXX',
+        'GOLD': 'XAU',
+        'PALLADIUM': 'XPD',
+        'PLATINUM': 'XPT',
+        'SILVER': 'XAG',
+    },
+    'currency_iso_to_currency_map': {
+        'AFN': 'Afghani',
+        'EUR': 'Euro',
+        'ALL': 'Lek',
+        'DZD': 'Algerian Dinar',
+        'USD': 'US Dollar',
+        'AOA': 'Kwanza',
+        'XCD': 'East Caribbean Dollar',
+        'ARS': 'Argentine Peso',
+        'AMD': 'Armenian Dram',
+        'AWG': 'Aruban Florin',
+        'AUD': 'Australian Dollar',
+        'AZN': 'Azerbaijan Manat',
+        'BSD': 'Bahamian Dollar',
+        'BHD': 'Bahraini Dinar',
+        'BDT': 'Taka',
+        'BBD': 'Barbados Dollar',
+        'BYN': 'Belarusian Ruble',
+        'BZD': 'Belize Dollar',
+        'XOF': 'CFA Franc BCEAO',
+        'BMD': 'Bermudian Dollar',
+        'INR': 'Indian Rupee',
+        'BTN': 'Ngultrum',
+        'BOB': 'Boliviano',
+        'BOV': 'Mvdol',
+        'BAM': 'Convertible Mark',
+        'BWP': 'Pula',
+        'NOK': 'Norwegian Krone',
+        'BRL': 'Brazilian Real',
+        'BND': 'Brunei Dollar',
+        'BGN': 'Bulgarian Lev',
+        'BIF': 'Burundi Franc',
+        'CVE': 'Cabo Verde Escudo',
+        'KHR': 'Riel',
+        'XAF': 'CFA Franc BEAC',
+        'CAD': 'Canadian Dollar',
+        'KYD': 'Cayman Islands Dollar',
+        'CLP': 'Chilean Peso',
+        'CLF': 'Unidad de Fomento',
+        'CNY': 'Yuan Renminbi',
+        'COP': 'Colombian Peso',
+        'COU': 'Unidad de Valor Real',
+        'KMF': 'Comorian Franc',
+        'CDF': 'Congolese Franc',
+        'NZD': 'New Zealand Dollar',
+        'CRC': 'Costa Rican Colon',
+        'HRK': 'Kuna',
+        'CUP': 'Cuban Peso',
+        'CUC': 'Peso Convertible',
+        'ANG': 'Netherlands Antillean Guilder',
+        'CZK': 'Czech Koruna',
+        'DKK': 'Danish Krone',
+        'DJF': 'Djibouti Franc',
+        'DOP': 'Dominican Peso',
+        'EGP': 'Egyptian Pound',
+        'SVC': 'El Salvador Colon',
+        'ERN': 'Nakfa',
+        'SZL': 'Lilangeni',
+        'ETB': 'Ethiopian Birr',
+        'FKP': 'Falkland Islands Pound',
+        'FJD': 'Fiji Dollar',
+        'XPF': 'CFP Franc',
+        'GMD': 'Dalasi',
+        'GEL': 'Lari',
+        'GHS': 'Ghana Cedi',
+        'GIP': 'Gibraltar Pound',
+        'GTQ': 'Quetzal',
+        'GBP': 'Pound Sterling',
+        'GNF': 'Guinean Franc',
+        'GYD': 'Guyana Dollar',
+        'HTG': 'Gourde',
+        'HNL': 'Lempira',
+        'HKD': 'Hong Kong Dollar',
+        'HUF': 'Forint',
+        'ISK': 'Iceland Krona',
+        'IDR': 'Rupiah',
+        'XDR': 'SDR (Special Drawing Right)',
+        'IRR': 'Iranian Rial',
+        'IQD': 'Iraqi Dinar',
+        'ILS': 'New Israeli Sheqel',
+        'JMD': 'Jamaican Dollar',
+        'JPY': 'Yen',
+        'JOD': 'Jordanian Dinar',
+        'KZT': 'Tenge',
+        'KES': 'Kenyan Shilling',
+        'KPW': 'North Korean Won',
+        'KRW': 'Won',
+        'KWD': 'Kuwaiti Dinar',
+        'KGS': 'Som',
+        'LAK': 'Lao Kip',
+        'LBP': 'Lebanese Pound',
+        'LSL': 'Loti',
+        'ZAR': 'Rand',
+        'LRD': 'Liberian Dollar',
+        'LYD': 'Libyan Dinar',
+        'CHF': 'Swiss Franc',
+        'MOP': 'Pataca',
+        'MKD': 'Denar',
+        'MGA': 'Malagasy Ariary',
+        'MWK': 'Malawi Kwacha',
+        'MYR': 'Malaysian Ringgit',
+        'MVR': 'Rufiyaa',
+        'MRU': 'Ouguiya',
+        'MUR': 'Mauritius Rupee',
+        'XUA': 'ADB Unit of Account',
+        'MXN': 'Mexican Peso',
+        'MXV': 'Mexican Unidad de Inversion (UDI)',
+        'MDL': 'Moldovan Leu',
+        'MNT': 'Tugrik',
+        'MAD': 'Moroccan Dirham',
+        'MZN': 'Mozambique Metical',
+        'MMK': 'Kyat',
+        'NAD': 'Namibia Dollar',
+        'NPR': 'Nepalese Rupee',
+        'NIO': 'Cordoba Oro',
+        'NGN': 'Naira',
+        'OMR': 'Rial Omani',
+        'PKR': 'Pakistan Rupee',
+        'PAB': 'Balboa',
+        'PGK': 'Kina',
+        'PYG': 'Guarani',
+        'PEN': 'Sol',
+        'PHP': 'Philippine Peso',
+        'PLN': 'Zloty',
+        'QAR': 'Qatari Rial',
+        'RON': 'Romanian Leu',
+        'RUB': 'Russian Ruble',
+        'RWF': 'Rwanda Franc',
+        'SHP': 'Saint Helena Pound',
+        'WST': 'Tala',
+        'STN': 'Dobra',
+        'SAR': 'Saudi Riyal',
+        'RSD': 'Serbian Dinar',
+        'SCR': 'Seychelles Rupee',
+        'SLL': 'Leone',
+        'SGD': 'Singapore Dollar',
+        'XSU': 'Sucre',
+        'SBD': 'Solomon Islands Dollar',
+        'SOS': 'Somali Shilling',
+        'SSP': 'South Sudanese Pound',
+        'LKR': 'Sri Lanka Rupee',
+        'SDG': 'Sudanese Pound',
+        'SRD': 'Surinam Dollar',
+        'SEK': 'Swedish Krona',
+        'CHE': 'WIR Euro',
+        'CHW': 'WIR Franc',
+        'SYP': 'Syrian Pound',
+        'TWD': 'New Taiwan Dollar',
+        'TJS': 'Somoni',
+        'TZS': 'Tanzanian Shilling',
+        'THB': 'Baht',
+        'TOP': "Pa'anga",
+        'TTD': 'Trinidad and Tobago Dollar',
+        'TND': 'Tunisian Dinar',
+        'TRY': 'Turkish Lira',
+        'TMT': 'Turkmenistan New Manat',
+        'UGX': 'Uganda Shilling',
+        'UAH': 'Hryvnia',
+        'AED': 'UAE Dirham',
+        'USN': 'US Dollar (Next day)',
+        'UYU': 'Peso Uruguayo',
+        'UYI': 'Uruguay Peso en Unidades Indexadas (UI)',
+        'UYW': 'Unidad Previsional',
+        'UZS': 'Uzbekistan Sum',
+        'VUV': 'Vatu',
+        'VES': 'Bolívar Soberano',
+        'VND': 'Dong',
+        'YER': 'Yemeni Rial',
+        'ZMW': 'Zambian Kwacha',
+        'ZWL': 'Zimbabwe Dollar',
+        'XBA': 'Bond Markets Unit European Composite Unit (EURCO)',
+        'XBB': 'Bond Markets Unit European Monetary Unit (E.M.U.-6)',
+        'XBC': 'Bond Markets Unit European Unit of Account 9 (E.U.A.-9)',
+        'XBD': 'Bond Markets Unit European Unit of Account 17 (E.U.A.-17)',
+        'XTS': 'Codes specifically reserved for testing purposes',
+        'XXX': 'The codes assigned for transactions where no currency is involved',
+        'XAU': 'Gold',
+        'XPD': 'Palladium',
+        'XPT': 'Platinum',
+        'XAG': 'Silver',
+    },
+    'currency_iso_to_countries_map': {
+        'AFN': frozenset({'AF'}),
+        'EUR': frozenset({'AD', 'AT', 'AX', 'BE', 'BL', 'CY', 'DE', 'EE', 'ES', 'EU', 'FI', 'FR', 'GF', 'GP', 'GR', 'IE', 'IT', 'LT', 'LU', 'LV', 'MC', 'ME', 'MF', 'MQ', 'MT', 'NL', 'PM', 'PT', 'RE', 'SI', 'SK', 'SM', 'TF', 'VA', 'YT'}),
+        'ALL': frozenset({'AL'}),
+        'DZD': frozenset({'DZ'}),
+        'USD': frozenset({'AS', 'BQ', 'EC', 'FM', 'GU', 'HT', 'IO', 'MH', 'MP', 'PA', 'PR', 'PW', 'SV', 'TC', 'TL', 'UM', 'US', 'VG', 'VI'}),
+        'AOA': frozenset({'AO'}),
+        'XCD': frozenset({'AG', 'AI', 'DM', 'GD', 'KN', 'LC', 'MS', 'Organisation of Eastern Caribbean States', 'VC'}),
+        'ARS': frozenset({'AR'}),
+        'AMD': frozenset({'AM'}),
+        'AWG': frozenset({'AW'}),
+        'AUD': frozenset({'AU', 'CC', 'CX', 'HM', 'KI', 'NF', 'NR', 'TV'}),
+        'AZN': frozenset({'AZ'}),
+        'BSD': frozenset({'BS'}),
+        'BHD': frozenset({'BH'}),
+        'BDT': frozenset({'BD'}),
+        'BBD': frozenset({'BB'}),
+        'BYN': frozenset({'BY'}),
+        'BZD': frozenset({'BZ'}),
+        'XOF': frozenset({'BF', 'BJ', 'CI', 'GW', 'ML', 'NE', 'SN', 'TG', 'West Africa'}),
+        'BMD': frozenset({'BM'}),
+        'INR': frozenset({'BT', 'IN'}),
+        'BTN': frozenset({'BT'}),
+        'BOB': frozenset({'BO'}),
+        'BOV': frozenset({'BO'}),
+        'BAM': frozenset({'BA'}),
+        'BWP': frozenset({'BW'}),
+        'NOK': frozenset({'BV', 'NO', 'SJ'}),
+        'BRL': frozenset({'BR'}),
+        'BND': frozenset({'BN'}),
+        'BGN': frozenset({'BG'}),
+        'BIF': frozenset({'BI'}),
+        'CVE': frozenset({'CV'}),
+        'KHR': frozenset({'KH'}),
+        'XAF': frozenset({'CF', 'CG', 'CM', 'Central African States', 'GA', 'GQ', 'TD'}),
+        'CAD': frozenset({'CA'}),
+        'KYD': frozenset({'KY'}),
+        'CLP': frozenset({'CL'}),
+        'CLF': frozenset({'CL'}),
+        'CNY': frozenset({'CN'}),
+        'COP': frozenset({'CO'}),
+        'COU': frozenset({'CO'}),
+        'KMF': frozenset({'KM'}),
+        'CDF': frozenset({'CD'}),
+        'NZD': frozenset({'CK', 'NU', 'NZ', 'PN', 'TK'}),
+        'CRC': frozenset({'CR'}),
+        'HRK': frozenset({'HR'}),
+        'CUP': frozenset({'CU'}),
+        'CUC': frozenset({'CU'}),
+        'ANG': frozenset({'CW', 'Netherlands Antilles', 'SX'}),
+        'CZK': frozenset({'CZ'}),
+        'DKK': frozenset({'DK', 'FO', 'GL'}),
+        'DJF': frozenset({'DJ'}),
+        'DOP': frozenset({'DO'}),
+        'EGP': frozenset({'EG'}),
+        'SVC': frozenset({'SV'}),
+        'ERN': frozenset({'ER'}),
+        'SZL': frozenset({'SZ'}),
+        'ETB': frozenset({'ET'}),
+        'FKP': frozenset({'FK'}),
+        'FJD': frozenset({'FJ'}),
+        'XPF': frozenset({'Change Franc Pacifique', 'NC', 'PF', 'WF'}),
+        'GMD': frozenset({'GM'}),
+        'GEL': frozenset({'GE'}),
+        'GHS': frozenset({'GH'}),
+        'GIP': frozenset({'GI'}),
+        'GTQ': frozenset({'GT'}),
+        'GBP': frozenset({'GB', 'GG', 'IM', 'JE'}),
+        'GNF': frozenset({'GN'}),
+        'GYD': frozenset({'GY'}),
+        'HTG': frozenset({'HT'}),
+        'HNL': frozenset({'HN'}),
+        'HKD': frozenset({'HK'}),
+        'HUF': frozenset({'HU'}),
+        'ISK': frozenset({'IS'}),
+        'IDR': frozenset({'ID'}),
+        'XDR': frozenset({'International Monetary Fund (IMF)'}),
+        'IRR': frozenset({'IR'}),
+        'IQD': frozenset({'IQ'}),
+        'ILS': frozenset({'IL'}),
+        'JMD': frozenset({'JM'}),
+        'JPY': frozenset({'JP'}),
+        'JOD': frozenset({'JO'}),
+        'KZT': frozenset({'KZ'}),
+        'KES': frozenset({'KE'}),
+        'KPW': frozenset({'KP'}),
+        'KRW': frozenset({'KR'}),
+        'KWD': frozenset({'KW'}),
+        'KGS': frozenset({'KG'}),
+        'LAK': frozenset({'LA'}),
+        'LBP': frozenset({'LB'}),
+        'LSL': frozenset({'LS'}),
+        'ZAR': frozenset({'LS', 'NA', 'ZA'}),
+        'LRD': frozenset({'LR'}),
+        'LYD': frozenset({'LY'}),
+        'CHF': frozenset({'CH', 'LI'}),
+        'MOP': frozenset({'MO'}),
+        'MKD': frozenset({'MK'}),
+        'MGA': frozenset({'MG'}),
+        'MWK': frozenset({'MW'}),
+        'MYR': frozenset({'MY'}),
+        'MVR': frozenset({'MV'}),
+        'MRU': frozenset({'MR'}),
+        'MUR': frozenset({'MU'}),
+        'XUA': frozenset({'Member Countries of the African Development Bank Group'}),
+        'MXN': frozenset({'MX'}),
+        'MXV': frozenset({'MX'}),
+        'MDL': frozenset({'MD'}),
+        'MNT': frozenset({'MN'}),
+        'MAD': frozenset({'EH', 'MA'}),
+        'MZN': frozenset({'MZ'}),
+        'MMK': frozenset({'MM'}),
+        'NAD': frozenset({'NA'}),
+        'NPR': frozenset({'NP'}),
+        'NIO': frozenset({'NI'}),
+        'NGN': frozenset({'NG'}),
+        'OMR': frozenset({'OM'}),
+        'PKR': frozenset({'PK'}),
+        'PAB': frozenset({'PA'}),
+        'PGK': frozenset({'PG'}),
+        'PYG': frozenset({'PY'}),
+        'PEN': frozenset({'PE'}),
+        'PHP': frozenset({'PH'}),
+        'PLN': frozenset({'PL'}),
+        'QAR': frozenset({'QA'}),
+        'RON': frozenset({'RO'}),
+        'RUB': frozenset({'RU'}),
+        'RWF': frozenset({'RW'}),
+        'SHP': frozenset({'SH'}),
+        'WST': frozenset({'WS'}),
+        'STN': frozenset({'ST'}),
+        'SAR': frozenset({'SA'}),
+        'RSD': frozenset({'RS'}),
+        'SCR': frozenset({'SC'}),
+        'SLL': frozenset({'SL'}),
+        'SGD': frozenset({'SG'}),
+        'XSU': frozenset({'Sistema Unitario de Compensacion Regional de Pagos "Sucre"'}),
+        'SBD': frozenset({'SB'}),
+        'SOS': frozenset({'SO'}),
+        'SSP': frozenset({'SS'}),
+        'LKR': frozenset({'LK'}),
+        'SDG': frozenset({'SD'}),
+        'SRD': frozenset({'SR'}),
+        'SEK': frozenset({'SE'}),
+        'CHE': frozenset({'CH'}),
+        'CHW': frozenset({'CH'}),
+        'SYP': frozenset({'SY'}),
+        'TWD': frozenset({'TW'}),
+        'TJS': frozenset({'TJ'}),
+        'TZS': frozenset({'TZ'}),
+        'THB': frozenset({'TH'}),
+        'TOP': frozenset({'TO'}),
+        'TTD': frozenset({'TT'}),
+        'TND': frozenset({'TN'}),
+        'TRY': frozenset({'TR'}),
+        'TMT': frozenset({'TM'}),
+        'UGX': frozenset({'UG'}),
+        'UAH': frozenset({'UA'}),
+        'AED': frozenset({'AE'}),
+        'USN': frozenset({'US'}),
+        'UYU': frozenset({'UY'}),
+        'UYI': frozenset({'UY'}),
+        'UYW': frozenset({'UY'}),
+        'UZS': frozenset({'UZ'}),
+        'VUV': frozenset({'VU'}),
+        'VES': frozenset({'VE'}),
+        'VND': frozenset({'VN'}),
+        'YER': frozenset({'YE'}),
+        'ZMW': frozenset({'ZM'}),
+        'ZWL': frozenset({'ZW'}),
+        'XBA': frozenset({'ZZ01_Bond Markets Unit European_EURCO'}),
+        'XBB': frozenset({'ZZ02_Bond Markets Unit European_EMU-6'}),
+        'XBC': frozenset({'ZZ03_Bond Markets Unit European_EUA-9'}),
+        'XBD': frozenset({'ZZ04_Bond Markets Unit European_EUA-17'}),
+        'XTS': frozenset({'ZZ06_Testing_Code'}),
+        'XXX': frozenset({'ZZ07_No_Currency'}),
+        'XAU': frozenset({'ZZ08_Gold'}),
+        'XPD': frozenset({'ZZ09_Palladium'}),
+        'XPT': frozenset({'ZZ10_Platinum'}),
+        'XAG': frozenset({'ZZ11_Silver'}),
+    },
+    'currency_iso_to_owner_country_map': {
+        'AUD': 'AU',
+        'XAF': 'Central African States',
+        'DKK': 'DK',
+        'XCD': 'Organisation of Eastern Caribbean States',
+        'EUR': 'EU',
+        'INR': 'IN',
+        'MAD': 'MA',
+        'NZD': 'NZ',
+        'NOK': 'NO',
+        'ANG': 'Netherlands Antilles',
+        'ZAR': 'ZA',
+        'CHF': 'CH',
+        'XOF': 'West Africa',
+        'GBP': 'GB',
+        'USD': 'US',
+        'XPF': 'Change Franc Pacifique',
+    },
+}
+
+COUNTRY_INDICES = {
+    'countries': (
+        'AF',
+        'AX',
+        'AL',
+        'DZ',
+        'AS',
+        'AD',
+        'AO',
+        'AI',
+        'AG',
+        'AR',
+        'AM',
+        'AW',
+        'AU',
+        'AT',
+        'AZ',
+        'BS',
+        'BH',
+        'BD',
+        'BB',
+        'BY',
+        'BE',
+        'BZ',
+        'BJ',
+        'BM',
+        'BT',
+        'BO',
+        'BQ',
+        'BA',
+        'BW',
+        'BV',
+        'BR',
+        'IO',
+        'BN',
+        'BG',
+        'BF',
+        'BI',
+        'CV',
+        'KH',
+        'CM',
+        'Central African States',
+        'CA',
+        'KY',
+        'CF',
+        'TD',
+        'CL',
+        'CN',
+        'CX',
+        'CC',
+        'CO',
+        'KM',
+        'CD',
+        'CG',
+        'CK',
+        'CR',
+        'CI',
+        'HR',
+        'CU',
+        'CW',
+        'CY',
+        'CZ',
+        'DK',
+        'DJ',
+        'DM',
+        'Organisation of Eastern Caribbean States',
+        'DO',
+        'EC',
+        'EG',
+        'SV',
+        'GQ',
+        'ER',
+        'EE',
+        'SZ',
+        'ET',
+        'EU',
+        'FK',
+        'FO',
+        'FJ',
+        'FI',
+        'FR',
+        'GF',
+        'PF',
+        'TF',
+        'GA',
+        'GM',
+        'GE',
+        'DE',
+        'GH',
+        'GI',
+        'GR',
+        'GL',
+        'GD',
+        'GP',
+        'GU',
+        'GT',
+        'GG',
+        'GN',
+        'GW',
+        'GY',
+        'HT',
+        'HM',
+        'VA',
+        'HN',
+        'HK',
+        'HU',
+        'IS',
+        'IN',
+        'ID',
+        'International Monetary Fund (IMF)',
+        'IR',
+        'IQ',
+        'IE',
+        'IM',
+        'IL',
+        'IT',
+        'JM',
+        'JP',
+        'JE',
+        'JO',
+        'KZ',
+        'KE',
+        'KI',
+        'KP',
+        'KR',
+        'KW',
+        'KG',
+        'LA',
+        'LV',
+        'LB',
+        'LS',
+        'LR',
+        'LY',
+        'LI',
+        'LT',
+        'LU',
+        'MO',
+        'MK',
+        'MG',
+        'MW',
+        'MY',
+        'MV',
+        'ML',
+        'MT',
+        'MH',
+        'MQ',
+        'MR',
+        'MU',
+        'YT',
+        'Member Countries of the African Development Bank Group',
+        'MX',
+        'FM',
+        'MD',
+        'MC',
+        'MN',
+        'ME',
+        'MS',
+        'MA',
+        'MZ',
+        'MM',
+        'NA',
+        'NR',
+        'NP',
+        'NL',
+        'NC',
+        'NZ',
+        'NI',
+        'NE',
+        'NG',
+        'NU',
+        'NF',
+        'MP',
+        'NO',
+        'OM',
+        'PK',
+        'PW',
+        'PA',
+        'PG',
+        'PY',
+        'PE',
+        'PH',
+        'PN',
+        'PL',
+        'PT',
+        'PR',
+        'QA',
+        'RE',
+        'RO',
+        'RU',
+        'RW',
+        'BL',
+        'SH',
+        'KN',
+        'LC',
+        'MF',
+        'PM',
+        'VC',
+        'WS',
+        'SM',
+        'ST',
+        'SA',
+        'SN',
+        'RS',
+        'SC',
+        'SL',
+        'SG',
+        'SX',
+        'Netherlands Antilles',
+        'Sistema Unitario de Compensacion Regional de Pagos "Sucre"',
+        'SK',
+        'SI',
+        'SB',
+        'SO',
+        'ZA',
+        'SS',
+        'ES',
+        'LK',
+        'SD',
+        'SR',
+        'SJ',
+        'SE',
+        'CH',
+        'SY',
+        'TW',
+        'TJ',
+        'TZ',
+        'TH',
+        'TL',
+        'TG',
+        'West Africa',
+        'TK',
+        'TO',
+        'TT',
+        'TN',
+        'TR',
+        'TM',
+        'TC',
+        'TV',
+        'UG',
+        'UA',
+        'AE',
+        'GB',
+        'UM',
+        'US',
+        'UY',
+        'UZ',
+        'VU',
+        'VE',
+        'VN',
+        'VG',
+        'VI',
+        'WF',
+        'Change Franc Pacifique',
+        'EH',
+        'YE',
+        'ZM',
+        'ZW',
+        'ZZ01_Bond Markets Unit European_EURCO',
+        'ZZ02_Bond Markets Unit European_EMU-6',
+        'ZZ03_Bond Markets Unit European_EUA-9',
+        'ZZ04_Bond Markets Unit European_EUA-17',
+        'ZZ06_Testing_Code',
+        'ZZ07_No_Currency',
+        'ZZ08_Gold',
+        'ZZ09_Palladium',
+        'ZZ10_Platinum',
+        'ZZ11_Silver',
+    ),
+    'country_to_currency_isos_map': {
+        'AF': frozenset({'AFN'}),
+        'AX': frozenset({'EUR'}),
+        'AL': frozenset({'ALL'}),
+        'DZ': frozenset({'DZD'}),
+        'AS': frozenset({'USD'}),
+        'AD': frozenset({'EUR'}),
+        'AO': frozenset({'AOA'}),
+        'AI': frozenset({'XCD'}),
+        'AG': frozenset({'XCD'}),
+        'AR': frozenset({'ARS'}),
+        'AM': frozenset({'AMD'}),
+        'AW': frozenset({'AWG'}),
+        'AU': frozenset({'AUD'}),
+        'AT': frozenset({'EUR'}),
+        'AZ': frozenset({'AZN'}),
+        'BS': frozenset({'BSD'}),
+        'BH': frozenset({'BHD'}),
+        'BD': frozenset({'BDT'}),
+        'BB': frozenset({'BBD'}),
+        'BY': frozenset({'BYN'}),
+        'BE': frozenset({'EUR'}),
+        'BZ': frozenset({'BZD'}),
+        'BJ': frozenset({'XOF'}),
+        'BM': frozenset({'BMD'}),
+        'BT': frozenset({'BTN', 'INR'}),
+        'BO': frozenset({'BOB', 'BOV'}),
+        'BQ': frozenset({'USD'}),
+        'BA': frozenset({'BAM'}),
+        'BW': frozenset({'BWP'}),
+        'BV': frozenset({'NOK'}),
+        'BR': frozenset({'BRL'}),
+        'IO': frozenset({'USD'}),
+        'BN': frozenset({'BND'}),
+        'BG': frozenset({'BGN'}),
+        'BF': frozenset({'XOF'}),
+        'BI': frozenset({'BIF'}),
+        'CV': frozenset({'CVE'}),
+        'KH': frozenset({'KHR'}),
+        'CM': frozenset({'XAF'}),
+        'CENTRAL AFRICAN STATES': frozenset({'XAF'}),
+        'CA': frozenset({'CAD'}),
+        'KY': frozenset({'KYD'}),
+        'CF': frozenset({'XAF'}),
+        'TD': frozenset({'XAF'}),
+        'CL': frozenset({'CLF', 'CLP'}),
+        'CN': frozenset({'CNY'}),
+        'CX': frozenset({'AUD'}),
+        'CC': frozenset({'AUD'}),
+        'CO': frozenset({'COP', 'COU'}),
+        'KM': frozenset({'KMF'}),
+        'CD': frozenset({'CDF'}),
+        'CG': frozenset({'XAF'}),
+        'CK': frozenset({'NZD'}),
+        'CR': frozenset({'CRC'}),
+        'CI': frozenset({'XOF'}),
+        'HR': frozenset({'HRK'}),
+        'CU': frozenset({'CUC', 'CUP'}),
+        'CW': frozenset({'ANG'}),
+        'CY': frozenset({'EUR'}),
+        'CZ': frozenset({'CZK'}),
+        'DK': frozenset({'DKK'}),
+        'DJ': frozenset({'DJF'}),
+        'DM': frozenset({'XCD'}),
+        'ORGANISATION OF EASTERN CARIBBEAN STATES': frozenset({'XCD'}),
+        'DO': frozenset({'DOP'}),
+        'EC': frozenset({'USD'}),
+        'EG': frozenset({'EGP'}),
+        'SV': frozenset({'SVC', 'USD'}),
+        'GQ': frozenset({'XAF'}),
+        'ER': frozenset({'ERN'}),
+        'EE': frozenset({'EUR'}),
+        'SZ': frozenset({'SZL'}),
+        'ET': frozenset({'ETB'}),
+        'EU': frozenset({'EUR'}),
+        'FK': frozenset({'FKP'}),
+        'FO': frozenset({'DKK'}),
+        'FJ': frozenset({'FJD'}),
+        'FI': frozenset({'EUR'}),
+        'FR': frozenset({'EUR'}),
+        'GF': frozenset({'EUR'}),
+        'PF': frozenset({'XPF'}),
+        'TF': frozenset({'EUR'}),
+        'GA': frozenset({'XAF'}),
+        'GM': frozenset({'GMD'}),
+        'GE': frozenset({'GEL'}),
+        'DE': frozenset({'EUR'}),
+        'GH': frozenset({'GHS'}),
+        'GI': frozenset({'GIP'}),
+        'GR': frozenset({'EUR'}),
+        'GL': frozenset({'DKK'}),
+        'GD': frozenset({'XCD'}),
+        'GP': frozenset({'EUR'}),
+        'GU': frozenset({'USD'}),
+        'GT': frozenset({'GTQ'}),
+        'GG': frozenset({'GBP'}),
+        'GN': frozenset({'GNF'}),
+        'GW': frozenset({'XOF'}),
+        'GY': frozenset({'GYD'}),
+        'HT': frozenset({'HTG', 'USD'}),
+        'HM': frozenset({'AUD'}),
+        'VA': frozenset({'EUR'}),
+        'HN': frozenset({'HNL'}),
+        'HK': frozenset({'HKD'}),
+        'HU': frozenset({'HUF'}),
+        'IS': frozenset({'ISK'}),
+        'IN': frozenset({'INR'}),
+        'ID': frozenset({'IDR'}),
+        'INTERNATIONAL MONETARY FUND (IMF)': frozenset({'XDR'}),
+        'IR': frozenset({'IRR'}),
+        'IQ': frozenset({'IQD'}),
+        'IE': frozenset({'EUR'}),
+        'IM': frozenset({'GBP'}),
+        'IL': frozenset({'ILS'}),
+        'IT': frozenset({'EUR'}),
+        'JM': frozenset({'JMD'}),
+        'JP': frozenset({'JPY'}),
+        'JE': frozenset({'GBP'}),
+        'JO': frozenset({'JOD'}),
+        'KZ': frozenset({'KZT'}),
+        'KE': frozenset({'KES'}),
+        'KI': frozenset({'AUD'}),
+        'KP': frozenset({'KPW'}),
+        'KR': frozenset({'KRW'}),
+        'KW': frozenset({'KWD'}),
+        'KG': frozenset({'KGS'}),
+        'LA': frozenset({'LAK'}),
+        'LV': frozenset({'EUR'}),
+        'LB': frozenset({'LBP'}),
+        'LS': frozenset({'LSL', 'ZAR'}),
+        'LR': frozenset({'LRD'}),
+        'LY': frozenset({'LYD'}),
+        'LI': frozenset({'CHF'}),
+        'LT': frozenset({'EUR'}),
+        'LU': frozenset({'EUR'}),
+        'MO': frozenset({'MOP'}),
+        'MK': frozenset({'MKD'}),
+        'MG': frozenset({'MGA'}),
+        'MW': frozenset({'MWK'}),
+        'MY': frozenset({'MYR'}),
+        'MV': frozenset({'MVR'}),
+        'ML': frozenset({'XOF'}),
+        'MT': frozenset({'EUR'}),
+        'MH': frozenset({'USD'}),
+        'MQ': frozenset({'EUR'}),
+        'MR': frozenset({'MRU'}),
+        'MU': frozenset({'MUR'}),
+        'YT': frozenset({'EUR'}),
+        'MEMBER COUNTRIES OF THE AFRICAN DEVELOPMENT BANK GROUP': frozenset({'XUA'}),
+        'MX': frozenset({'MXN', 'MXV'}),
+        'FM': frozenset({'USD'}),
+        'MD': frozenset({'MDL'}),
+        'MC': frozenset({'EUR'}),
+        'MN': frozenset({'MNT'}),
+        'ME': frozenset({'EUR'}),
+        'MS': frozenset({'XCD'}),
+        'MA': frozenset({'MAD'}),
+        'MZ': frozenset({'MZN'}),
+        'MM': frozenset({'MMK'}),
+        'NA': frozenset({'NAD', 'ZAR'}),
+        'NR': frozenset({'AUD'}),
+        'NP': frozenset({'NPR'}),
+        'NL': frozenset({'EUR'}),
+        'NC': frozenset({'XPF'}),
+        'NZ': frozenset({'NZD'}),
+        'NI': frozenset({'NIO'}),
+        'NE': frozenset({'XOF'}),
+        'NG': frozenset({'NGN'}),
+        'NU': frozenset({'NZD'}),
+        'NF': frozenset({'AUD'}),
+        'MP': frozenset({'USD'}),
+        'NO': frozenset({'NOK'}),
+        'OM': frozenset({'OMR'}),
+        'PK': frozenset({'PKR'}),
+        'PW': frozenset({'USD'}),
+        'PA': frozenset({'PAB', 'USD'}),
+        'PG': frozenset({'PGK'}),
+        'PY': frozenset({'PYG'}),
+        'PE': frozenset({'PEN'}),
+        'PH': frozenset({'PHP'}),
+        'PN': frozenset({'NZD'}),
+        'PL': frozenset({'PLN'}),
+        'PT': frozenset({'EUR'}),
+        'PR': frozenset({'USD'}),
+        'QA': frozenset({'QAR'}),
+        'RE': frozenset({'EUR'}),
+        'RO': frozenset({'RON'}),
+        'RU': frozenset({'RUB'}),
+        'RW': frozenset({'RWF'}),
+        'BL': frozenset({'EUR'}),
+        'SH': frozenset({'SHP'}),
+        'KN': frozenset({'XCD'}),
+        'LC': frozenset({'XCD'}),
+        'MF': frozenset({'EUR'}),
+        'PM': frozenset({'EUR'}),
+        'VC': frozenset({'XCD'}),
+        'WS': frozenset({'WST'}),
+        'SM': frozenset({'EUR'}),
+        'ST': frozenset({'STN'}),
+        'SA': frozenset({'SAR'}),
+        'SN': frozenset({'XOF'}),
+        'RS': frozenset({'RSD'}),
+        'SC': frozenset({'SCR'}),
+        'SL': frozenset({'SLL'}),
+        'SG': frozenset({'SGD'}),
+        'SX': frozenset({'ANG'}),
+        'NETHERLANDS ANTILLES': frozenset({'ANG'}),
+        'SISTEMA UNITARIO DE COMPENSACION REGIONAL DE PAGOS "SUCRE"': frozenset({'XSU'}),
+        'SK': frozenset({'EUR'}),
+        'SI': frozenset({'EUR'}),
+        'SB': frozenset({'SBD'}),
+        'SO': frozenset({'SOS'}),
+        'ZA': frozenset({'ZAR'}),
+        'SS': frozenset({'SSP'}),
+        'ES': frozenset({'EUR'}),
+        'LK': frozenset({'LKR'}),
+        'SD': frozenset({'SDG'}),
+        'SR': frozenset({'SRD'}),
+        'SJ': frozenset({'NOK'}),
+        'SE': frozenset({'SEK'}),
+        'CH': frozenset({'CHE', 'CHF', 'CHW'}),
+        'SY': frozenset({'SYP'}),
+        'TW': frozenset({'TWD'}),
+        'TJ': frozenset({'TJS'}),
+        'TZ': frozenset({'TZS'}),
+        'TH': frozenset({'THB'}),
+        'TL': frozenset({'USD'}),
+        'TG': frozenset({'XOF'}),
+        'WEST AFRICA': frozenset({'XOF'}),
+        'TK': frozenset({'NZD'}),
+        'TO': frozenset({'TOP'}),
+        'TT': frozenset({'TTD'}),
+        'TN': frozenset({'TND'}),
+        'TR': frozenset({'TRY'}),
+        'TM': frozenset({'TMT'}),
+        'TC': frozenset({'USD'}),
+        'TV': frozenset({'AUD'}),
+        'UG': frozenset({'UGX'}),
+        'UA': frozenset({'UAH'}),
+        'AE': frozenset({'AED'}),
+        'GB': frozenset({'GBP'}),
+        'UM': frozenset({'USD'}),
+        'US': frozenset({'USD', 'USN'}),
+        'UY': frozenset({'UYI', 'UYU', 'UYW'}),
+        'UZ': frozenset({'UZS'}),
+        'VU': frozenset({'VUV'}),
+        'VE': frozenset({'VES'}),
+        'VN': frozenset({'VND'}),
+        'VG': frozenset({'USD'}),
+        'VI': frozenset({'USD'}),
+        'WF': frozenset({'XPF'}),
+        'CHANGE FRANC PACIFIQUE': frozenset({'XPF'}),
+        'EH': frozenset({'MAD'}),
+        'YE': frozenset({'YER'}),
+        'ZM': frozenset({'ZMW'}),
+        'ZW': frozenset({'ZWL'}),
+        'ZZ01_BOND MARKETS UNIT EUROPEAN_EURCO': frozenset({'XBA'}),
+        'ZZ02_BOND MARKETS UNIT EUROPEAN_EMU-6': frozenset({'XBB'}),
+        'ZZ03_BOND MARKETS UNIT EUROPEAN_EUA-9': frozenset({'XBC'}),
+        'ZZ04_BOND MARKETS UNIT EUROPEAN_EUA-17': frozenset({'XBD'}),
+        'ZZ06_TESTING_CODE': frozenset({'XTS'}),
+        'ZZ07_NO_CURRENCY': frozenset({'XXX'}),
+        'ZZ08_GOLD': frozenset({'XAU'}),
+        'ZZ09_PALLADIUM': frozenset({'XPD'}),
+        'ZZ10_PLATINUM': frozenset({'XPT'}),
+        'ZZ11_SILVER': frozenset({'XAG'}),
+    },
+    'country_to_primary_currency_iso_map': {
+        'BT': 'BTN',
+        'BO': 'BOB',
+        'CL': 'CLP',
+        'CO': 'COP',
+        'CU': 'CUP',
+        'SV': 'SVC',
+        'HT': 'HTG',
+        'LS': 'LSL',
+        'MX': 'MXN',
+        'NA': 'NAD',
+        'PA': 'PAB',
+        'CH': 'CHF',
+        'US': 'USD',
+        'UY': 'UYU',
+    },
+    'country_to_sole_currency_iso_map': {
+        'AF': 'AFN',
+        'AX': 'EUR',
+        'AL': 'ALL',
+        'DZ': 'DZD',
+        'AS': 'USD',
+        'AD': 'EUR',
+        'AO': 'AOA',
+        'AI': 'XCD',
+        'AG': 'XCD',
+        'AR': 'ARS',
+        'AM': 'AMD',
+        'AW': 'AWG',
+        'AU': 'AUD',
+        'AT': 'EUR',
+        'AZ': 'AZN',
+        'BS': 'BSD',
+        'BH': 'BHD',
+        'BD': 'BDT',
+        'BB': 'BBD',
+        'BY': 'BYN',
+        'BE': 'EUR',
+        'BZ': 'BZD',
+        'BJ': 'XOF',
+        'BM': 'BMD',
+        'BQ': 'USD',
+        'BA': 'BAM',
+        'BW': 'BWP',
+        'BV': 'NOK',
+        'BR': 'BRL',
+        'IO': 'USD',
+        'BN': 'BND',
+        'BG': 'BGN',
+        'BF': 'XOF',
+        'BI': 'BIF',
+        'CV': 'CVE',
+        'KH': 'KHR',
+        'CM': 'XAF',
+        'CENTRAL AFRICAN STATES': 'XAF',
+        'CA': 'CAD',
+        'KY': 'KYD',
+        'CF': 'XAF',
+        'TD': 'XAF',
+        'CN': 'CNY',
+        'CX': 'AUD',
+        'CC': 'AUD',
+        'KM': 'KMF',
+        'CD': 'CDF',
+        'CG': 'XAF',
+        'CK': 'NZD',
+        'CR': 'CRC',
+        'CI': 'XOF',
+        'HR': 'HRK',
+        'CW': 'ANG',
+        'CY': 'EUR',
+        'CZ': 'CZK',
+        'DK': 'DKK',
+        'DJ': 'DJF',
+        'DM': 'XCD',
+        'ORGANISATION OF EASTERN CARIBBEAN STATES': 'XCD',
+        'DO': 'DOP',
+        'EC': 'USD',
+        'EG': 'EGP',
+        'GQ': 'XAF',
+        'ER': 'ERN',
+        'EE': 'EUR',
+        'SZ': 'SZL',
+        'ET': 'ETB',
+        'EU': 'EUR',
+        'FK': 'FKP',
+        'FO': 'DKK',
+        'FJ': 'FJD',
+        'FI': 'EUR',
+        'FR': 'EUR',
+        'GF': 'EUR',
+        'PF': 'XPF',
+        'TF': 'EUR',
+        'GA': 'XAF',
+        'GM': 'GMD',
+        'GE': 'GEL',
+        'DE': 'EUR',
+        'GH': 'GHS',
+        'GI': 'GIP',
+        'GR': 'EUR',
+        'GL': 'DKK',
+        'GD': 'XCD',
+        'GP': 'EUR',
+        'GU': 'USD',
+        'GT': 'GTQ',
+        'GG': 'GBP',
+        'GN': 'GNF',
+        'GW': 'XOF',
+        'GY': 'GYD',
+        'HM': 'AUD',
+        'VA': 'EUR',
+        'HN': 'HNL',
+        'HK': 'HKD',
+        'HU': 'HUF',
+        'IS': 'ISK',
+        'IN': 'INR',
+        'ID': 'IDR',
+        'INTERNATIONAL MONETARY FUND (IMF)': 'XDR',
+        'IR': 'IRR',
+        'IQ': 'IQD',
+        'IE': 'EUR',
+        'IM': 'GBP',
+        'IL': 'ILS',
+        'IT': 'EUR',
+        'JM': 'JMD',
+        'JP': 'JPY',
+        'JE': 'GBP',
+        'JO': 'JOD',
+        'KZ': 'KZT',
+        'KE': 'KES',
+        'KI': 'AUD',
+        'KP': 'KPW',
+        'KR': 'KRW',
+        'KW': 'KWD',
+        'KG': 'KGS',
+        'LA': 'LAK',
+        'LV': 'EUR',
+        'LB': 'LBP',
+        'LR': 'LRD',
+        'LY': 'LYD',
+        'LI': 'CHF',
+        'LT': 'EUR',
+        'LU': 'EUR',
+        'MO': 'MOP',
+        'MK': 'MKD',
+        'MG': 'MGA',
+        'MW': 'MWK',
+        'MY': 'MYR',
+        'MV': 'MVR',
+        'ML': 'XOF',
+        'MT': 'EUR',
+        'MH': 'USD',
+        'MQ': 'EUR',
+        'MR': 'MRU',
+        'MU': 'MUR',
+        'YT': 'EUR',
+        'MEMBER COUNTRIES OF THE AFRICAN DEVELOPMENT BANK GROUP': 'XUA',
+        'FM': 'USD',
+        'MD': 'MDL',
+        'MC': 'EUR',
+        'MN': 'MNT',
+        'ME': 'EUR',
+        'MS': 'XCD',
+        'MA': 'MAD',
+        'MZ': 'MZN',
+        'MM': 'MMK',
+        'NR': 'AUD',
+        'NP': 'NPR',
+        'NL': 'EUR',
+        'NC': 'XPF',
+        'NZ': 'NZD',
+        'NI': 'NIO',
+        'NE': 'XOF',
+        'NG': 'NGN',
+        'NU': 'NZD',
+        'NF': 'AUD',
+        'MP': 'USD',
+        'NO': 'NOK',
+        'OM': 'OMR',
+        'PK': 'PKR',
+        'PW': 'USD',
+        'PG': 'PGK',
+        'PY': 'PYG',
+        'PE': 'PEN',
+        'PH': 'PHP',
+        'PN': 'NZD',
+        'PL': 'PLN',
+        'PT': 'EUR',
+        'PR': 'USD',
+        'QA': 'QAR',
+        'RE': 'EUR',
+        'RO': 'RON',
+        'RU': 'RUB',
+        'RW': 'RWF',
+        'BL': 'EUR',
+        'SH': 'SHP',
+        'KN': 'XCD',
+        'LC': 'XCD',
+        'MF': 'EUR',
+        'PM': 'EUR',
+        'VC': 'XCD',
+        'WS': 'WST',
+        'SM': 'EUR',
+        'ST': 'STN',
+        'SA': 'SAR',
+        'SN': 'XOF',
+        'RS': 'RSD',
+        'SC': 'SCR',
+        'SL': 'SLL',
+        'SG': 'SGD',
+        'SX': 'ANG',
+        'NETHERLANDS ANTILLES': 'ANG',
+        'SISTEMA UNITARIO DE COMPENSACION REGIONAL DE PAGOS "SUCRE"': 'XSU',
+        'SK': 'EUR',
+        'SI': 'EUR',
+        'SB': 'SBD',
+        'SO': 'SOS',
+        'ZA': 'ZAR',
+        'SS': 'SSP',
+        'ES': 'EUR',
+        'LK': 'LKR',
+        'SD': 'SDG',
+        'SR': 'SRD',
+        'SJ': 'NOK',
+        'SE': 'SEK',
+        'SY': 'SYP',
+        'TW': 'TWD',
+        'TJ': 'TJS',
+        'TZ': 'TZS',
+        'TH': 'THB',
+        'TL': 'USD',
+        'TG': 'XOF',
+        'WEST AFRICA': 'XOF',
+        'TK': 'NZD',
+        'TO': 'TOP',
+        'TT': 'TTD',
+        'TN': 'TND',
+        'TR': 'TRY',
+        'TM': 'TMT',
+        'TC': 'USD',
+        'TV': 'AUD',
+        'UG': 'UGX',
+        'UA': 'UAH',
+        'AE': 'AED',
+        'GB': 'GBP',
+        'UM': 'USD',
+        'UZ': 'UZS',
+        'VU': 'VUV',
+        'VE': 'VES',
+        'VN': 'VND',
+        'VG': 'USD',
+        'VI': 'USD',
+        'WF': 'XPF',
+        'CHANGE FRANC PACIFIQUE': 'XPF',
+        'EH': 'MAD',
+        'YE': 'YER',
+        'ZM': 'ZMW',
+        'ZW': 'ZWL',
+        'ZZ01_BOND MARKETS UNIT EUROPEAN_EURCO': 'XBA',
+        'ZZ02_BOND MARKETS UNIT EUROPEAN_EMU-6': 'XBB',
+        'ZZ03_BOND MARKETS UNIT EUROPEAN_EUA-9': 'XBC',
+        'ZZ04_BOND MARKETS UNIT EUROPEAN_EUA-17': 'XBD',
+        'ZZ06_TESTING_CODE': 'XTS',
+        'ZZ07_NO_CURRENCY': 'XXX',
+        'ZZ08_GOLD': 'XAU',
+        'ZZ09_PALLADIUM': 'XPD',
+        'ZZ10_PLATINUM': 'XPT',
+        'ZZ11_SILVER': 'XAG',
+    },
+}
@@ -0,0 +1,95 @@
+"""
+Generate the iso_4217_data module of literal ISO 4217 currency code lookup maps from the json data.
+
+Usage:
+    python -m currency_codes.tools.gen_iso_data [Options]
+
+[Options]
+    --check:  Don't write the module, just report whether it is up to date with the json data.
+
+Rerun whenever iso_4217_currency_codes.json changes; FxCodes raises an FxCodesException if it parses json data that the generated maps
+were not generated from.
+"""
+
+###############################################################################################################################################################
+#
+#       Import
+#
+###############################################################################################################################################################
+
+import argparse
+import hashlib
+
+from currency_codes.iso_4217_currency_codes import FxCodes, SCRIPT_DIR
+
+
+###############################################################################################################################################################
+#
+#       Global
+#
+###############################################################################################################################################################
+
+DATA_MODULE_FILE = SCRIPT_DIR/"iso_4217_data.py"
+
+
+###############################################################################################################################################################
+#
+#       literal
+#
+###############################################################################################################################################################
+
+def literal(value: object, indent: int = 0) -> str:
+    """ Return python source for value, one item per line for dicts and tuples, with sorted sets so the output is reproducible. """
+    pad = "    "*(indent + 1)
+    if isinstance(value, dict):
+        return "{\n" + "".join(f"{pad}{literal(key)}: {literal(item, indent + 1)},\n" for key, item in value.items()) + "    "*indent + "}"
+    elif isinstance(value, tuple):
+        return "(\n" + "".join(f"{pad}{literal(item, indent + 1)},\n" for item in value) + "    "*indent + ")"
+    elif isinstance(value, frozenset):
+        return "frozenset({" + ", ".join(literal(item) for item in sorted(value)) + "})"
+    return repr(value)
+
+
+###############################################################################################################################################################
+#
+#       gen_iso_data
+#
+###############################################################################################################################################################
+
+def gen_iso_data(check: bool) -> int:
+    # Ignore the existing module so the maps are rebuilt from the json data.
+    fx_codes = FxCodes(use_generated_data=False)
+    lines = [
+        '"""',
+        "Literal ISO 4217 currency code lookup maps.",
+        "",
+        "Generated from iso_4217_currency_codes.json by tools/gen_iso_data.py - do not edit.",
+        '"""',
+        "",
+        f'DATA_FILE_SHA256 = "{hashlib.sha256(FxCodes.DATA_FILE.read_bytes()).hexdigest()}"',
+    ]
+    for name, constant in FxCodes.GENERATED_PROPERTIES.items():
+        lines += ["", f"{constant} = {literal(getattr(fx_codes, name))}"]
+    source = "\n".join(lines) + "\n"
+    if check:
+        if not DATA_MODULE_FILE.exists() or DATA_MODULE_FILE.read_text(encoding="utf-8") != source:
+            print(f"{DATA_MODULE_FILE} is out of date with {FxCodes.DATA_FILE}")
+            return -1
+        print(f"{DATA_MODULE_FILE} is up to date")
+        return 0
+    DATA_MODULE_FILE.write_text(source, encoding="utf-8")
+    print(f"Wrote {DATA_MODULE_FILE}")
+    return 0
+
+
+###############################################################################################################################################################
+#
+#       __main__
+#
+###############################################################################################################################################################
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--check", action="store_true", help="Only report whether the generated module is up to date with the json data.")
+    args = parser.parse_args()
+    exit(gen_iso_data(args.check))